@@ -1,7 +1,8 @@
 from .account import Account, AccountInfoDouble, AccountInfoInteger, AccountStopoutMode, AccountTradeMode
-from .chart import StandardTimeframe, NonStandardTimeframe, parse_timeframe, OHLCV
+from .chart import StandardTimeframe, NonStandardTimeframe, parse_timeframe, OHLCV, OHLCV_DTYPE, drawdown, \
+    resample
 from .errors import MT4Error
 from .symbol import Symbol, SymbolTick, SymbolInfoInteger, SymbolCalcMode, SymbolTradeMode, SymbolTradeExecution, \
     SymbolSwapMode, DayOfWeek
 from .signal import Signal
-from .order import Order, OrderType
+from .order import Order, OrderType, ORDER_DTYPE
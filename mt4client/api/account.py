@@ -1,6 +1,7 @@
 from __future__ import annotations
 from enum import Enum
-from typing import TYPE_CHECKING
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
 if TYPE_CHECKING:
     from mt4client.client import MT4Client
 
@@ -66,17 +67,45 @@ class AccountTradeMode(Enum):
     ACCOUNT_TRADE_MODE_REAL = 2
 
 
+# value-to-member tables, which are cheaper to index than calling the Enum class
+_STOPOUT_MODES = {mode.value: mode for mode in AccountStopoutMode}
+_TRADE_MODES = {mode.value: mode for mode in AccountTradeMode}
+
+# the properties exposed by `Account`, fetched together by `Account.refresh()`
+_PROPERTIES: Tuple[Union[AccountInfoInteger, AccountInfoDouble], ...] = (
+    AccountInfoInteger.ACCOUNT_LEVERAGE,
+    AccountInfoInteger.ACCOUNT_LIMIT_ORDERS,
+    AccountInfoInteger.ACCOUNT_MARGIN_SO_MODE,
+    AccountInfoInteger.ACCOUNT_TRADE_ALLOWED,
+    AccountInfoInteger.ACCOUNT_TRADE_EXPERT,
+    AccountInfoDouble.ACCOUNT_BALANCE,
+    AccountInfoDouble.ACCOUNT_CREDIT,
+    AccountInfoDouble.ACCOUNT_PROFIT,
+    AccountInfoDouble.ACCOUNT_EQUITY,
+    AccountInfoDouble.ACCOUNT_MARGIN,
+    AccountInfoDouble.ACCOUNT_MARGIN_FREE,
+    AccountInfoDouble.ACCOUNT_MARGIN_LEVEL,
+    AccountInfoDouble.ACCOUNT_MARGIN_SO_CALL,
+    AccountInfoDouble.ACCOUNT_MARGIN_SO_SO,
+)
+
+
 class Account:
     """A MetaTrader 4 account."""
 
+    __slots__ = ("_mt4", "_cache", "_ttl", "login", "trade_mode", "name", "server", "currency", "company")
+
     def __init__(self, mt4: MT4Client, login: int, trade_mode: int, name: str, server: str, currency: str,
-                 company: str):
+                 company: str, cache_ttl: float = 0):
         self._mt4 = mt4
 
+        self._cache: Dict[Union[AccountInfoInteger, AccountInfoDouble], Tuple[float, Any]] = {}
+        self._ttl = cache_ttl
+
         self.login = login
         """The account number."""
 
-        self.trade_mode: AccountTradeMode = AccountTradeMode(trade_mode)
+        self.trade_mode: AccountTradeMode = _TRADE_MODES[trade_mode]
         """Account trade mode."""
 
         self.name = name
@@ -105,7 +134,7 @@ class Account:
     def margin_so_mode(self) -> AccountStopoutMode:
         """Mode for setting the minimal allowed margin."""
         val = self._get_account_info_integer(AccountInfoInteger.ACCOUNT_MARGIN_SO_MODE)
-        return AccountStopoutMode(val)
+        return _STOPOUT_MODES[val]
 
     @property
     def trade_allowed(self) -> bool:
@@ -168,17 +197,45 @@ class Account:
         """
         return self._get_account_info_double(AccountInfoDouble.ACCOUNT_MARGIN_SO_SO)
 
-    def _get_account_info_integer(self, prop: AccountInfoInteger) -> int:
-        return self._mt4._get_response(request={
-            "action": "GET_ACCOUNT_INFO_INTEGER",
+    def refresh(self) -> Dict[Union[AccountInfoInteger, AccountInfoDouble], Any]:
+        """
+        Fetch all of the account properties at once, filling the cache.
+
+        :return:    The raw fetched values, keyed by property.
+        """
+        now = monotonic()
+        values = self._mt4._get_responses([{
+            "action": "GET_ACCOUNT_INFO_INTEGER" if isinstance(prop, AccountInfoInteger) else "GET_ACCOUNT_INFO_DOUBLE",
             "property_id": prop.value
-        })
+        } for prop in _PROPERTIES])
+        for prop, val in zip(_PROPERTIES, values):
+            self._cache[prop] = (now, val)
+        return dict(zip(_PROPERTIES, values))
+
+    def _get_account_info_integer(self, prop: AccountInfoInteger) -> int:
+        return self._get_account_info("GET_ACCOUNT_INFO_INTEGER", prop)
 
     def _get_account_info_double(self, prop: AccountInfoDouble) -> float:
-        return self._mt4._get_response(request={
-            "action": "GET_ACCOUNT_INFO_DOUBLE",
+        return self._get_account_info("GET_ACCOUNT_INFO_DOUBLE", prop)
+
+    def _get_account_info(self, action: str, prop: Union[AccountInfoInteger, AccountInfoDouble]) -> Any:
+        """
+        Get an account property, reusing the last value if it was fetched less than `cache_ttl` seconds ago.
+
+        :param action:  The request action.
+        :param prop:    The account property.
+        :return:        The property value.
+        """
+        now = monotonic()
+        cached = self._cache.get(prop)
+        if cached is not None and now - cached[0] < self._ttl:
+            return cached[1]
+        val = self._mt4._get_response(request={
+            "action": action,
             "property_id": prop.value
         })
+        self._cache[prop] = (now, val)
+        return val
 
     def __repr__(self):
         return (f'{self.__class__.__name__}('
@@ -1,7 +1,13 @@
 from enum import Enum
-from typing import Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 import re
 
+if TYPE_CHECKING:
+    import numpy
+
+_TIMEFRAME_PATTERN = re.compile(r"(\d+)([mhdwn]+)", re.IGNORECASE)
+
 
 class StandardTimeframe(Enum):
     """The standard timeframes available for chart data in MetaTrader 4.
@@ -60,7 +66,9 @@ class OHLCV(object):
         https://docs.mql4.com/constants/structures/mqlrates
     """
 
-    def __init__(self, open: int, high: int, low: int, close: int, tick_volume: int, time: int):
+    __slots__ = ("open", "high", "low", "close", "tick_volume", "time")
+
+    def __init__(self, open: float, high: float, low: float, close: float, tick_volume: int, time: int):
         self.open = open
         """The period start time."""
 
@@ -89,6 +97,11 @@ class OHLCV(object):
                 f'time={self.time})')
 
 
+OHLCV_DTYPE = [("open", "f8"), ("high", "f8"), ("low", "f8"), ("close", "f8"), ("tick_volume", "i8"), ("time", "i8")]
+"""The layout of an OHLCV bar in a NumPy structured array, for use with `numpy.dtype()`."""
+
+
+@lru_cache(maxsize=64)
 def parse_timeframe(timeframe: str) -> Union[StandardTimeframe, NonStandardTimeframe]:
     """
     Parses a timeframe string.  An exception is raised if timeframe is invalid or parsing fails.
@@ -99,8 +112,7 @@ def parse_timeframe(timeframe: str) -> Union[StandardTimeframe, NonStandardTimef
     if timeframe == "0":
         return StandardTimeframe.PERIOD_CURRENT
 
-    p = re.compile(r"(\d+)([mhdwn]+)", re.IGNORECASE)
-    m = p.match(timeframe)
+    m = _TIMEFRAME_PATTERN.match(timeframe)
     if m is not None and len(m.groups()) == 2:
         name = "PERIOD_" + m.group(2).upper() + m.group(1)
         try:
@@ -111,3 +123,74 @@ def parse_timeframe(timeframe: str) -> Union[StandardTimeframe, NonStandardTimef
             except KeyError:
                 pass
     raise ValueError("Invalid timeframe: " + timeframe)
+
+
+def _to_array(rows: List[Dict[str, Any]], dtype: List[Tuple[str, str]]) -> "numpy.ndarray":
+    """
+    Converts decoded response objects to a NumPy structured array.  Requires NumPy.
+
+    :param rows:    The response objects, each having a key for every field of `dtype`.
+    :param dtype:   The array layout, eg. `OHLCV_DTYPE`.
+    :return:        An array with one element per row.
+    """
+    import numpy as np
+    # fill column-by-column, which lets NumPy convert each homogeneous list in one pass
+    arr = np.empty(len(rows), dtype=dtype)
+    for name, _ in dtype:
+        arr[name] = [row[name] for row in rows]
+    return arr
+
+
+def drawdown(close: "numpy.ndarray") -> "numpy.ndarray":
+    """
+    Computes the running drawdown of a price series, ie. the fractional distance of each price below the highest price
+    seen so far.  Requires NumPy.
+
+    :param close:   The prices, oldest-to-newest, eg. the `close` field of `Symbol.ohlcv_array()`.
+    :return:        An array of the same length, with values <= 0 (eg. -0.05 is 5% below the running peak).
+    """
+    import numpy as np
+    close = np.asarray(close, dtype=np.float64)
+    return close / np.maximum.accumulate(close) - 1.0
+
+
+def resample(bars: "numpy.ndarray", timeframe: Union[str, StandardTimeframe, NonStandardTimeframe]) -> "numpy.ndarray":
+    """
+    Aggregates OHLCV bars into a longer timeframe locally, eg. M1 bars from `Symbol.ohlcv_array()` into M5 or H1 bars,
+    so that several timeframes can be derived from a single fetch.  Requires NumPy.
+
+    Each output bar covers a window of the target period aligned to the epoch; windows never overlap.  Weekly and
+    monthly timeframes are not supported, as MetaTrader 4 aligns those to calendar boundaries.
+
+    :param bars:        Bars with the fields of `OHLCV_DTYPE`, sorted oldest-to-newest.
+    :param timeframe:   The target period, which must be a multiple of the period of `bars`.
+    :return:            An array of the aggregated bars, with the fields of `OHLCV_DTYPE`.
+    :raises:            ValueError if the target period is unsupported, or not a multiple of the period of `bars`.
+    """
+    import numpy as np
+    if isinstance(timeframe, str):
+        timeframe = parse_timeframe(timeframe)
+    if timeframe.value <= 0 or timeframe.value >= StandardTimeframe.PERIOD_W1.value:
+        raise ValueError("Unsupported resampling timeframe: " + timeframe.name)
+    if len(bars) == 0:
+        return bars[:0]
+
+    seconds = timeframe.value * 60
+    # the smallest spacing between bars is their period, as market closures only ever widen it
+    spacings = np.diff(bars["time"])
+    spacings = spacings[spacings > 0]
+    if len(spacings) and seconds % int(spacings.min()) != 0:
+        raise ValueError(f"Resampling timeframe {timeframe.name} is not a multiple of the {int(spacings.min())}s "
+                         f"period of the bars")
+    window = bars["time"] // seconds
+    starts = np.flatnonzero(np.r_[True, window[1:] != window[:-1]])
+    ends = np.r_[starts[1:], len(bars)] - 1
+
+    out = np.empty(len(starts), dtype=bars.dtype)
+    out["open"] = bars["open"][starts]
+    out["high"] = np.maximum.reduceat(bars["high"], starts)
+    out["low"] = np.minimum.reduceat(bars["low"], starts)
+    out["close"] = bars["close"][ends]
+    out["tick_volume"] = np.add.reduceat(bars["tick_volume"], starts)
+    out["time"] = window[starts] * seconds
+    return out
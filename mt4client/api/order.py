@@ -1,4 +1,5 @@
 from enum import Enum
+from operator import attrgetter, itemgetter
 
 
 class OrderType(Enum):
@@ -10,6 +11,12 @@ class OrderType(Enum):
         https://www.mql5.com/en/forum/122847
     """
 
+    # set on each member below the class definition; annotations are not enum members
+    _is_buy: bool
+    _is_sell: bool
+    _is_market: bool
+    _is_pending: bool
+
     OP_BUY = 0
     OP_SELL = 1
     OP_BUYLIMIT = 2
@@ -26,51 +33,58 @@ class OrderType(Enum):
         """
         :return: Whether the order type is a buy offer.
         """
-        return self == OrderType.OP_BUY or self == OrderType.OP_BUYLIMIT or self == OrderType.OP_BUYSTOP
+        return self._is_buy
 
     @property
     def is_sell(self) -> bool:
         """
         :return: Whether the order type is a sell offer.
         """
-        return self == OrderType.OP_SELL or self == OrderType.OP_SELLLIMIT or self == OrderType.OP_SELLSTOP
+        return self._is_sell
 
     @property
     def is_market(self) -> bool:
         """
         :return:    Whether the order type is market.
         """
-        return self == OrderType.OP_BUY or self == OrderType.OP_SELL
+        return self._is_market
 
     @property
     def is_pending(self) -> bool:
         """
         :return: Whether the order type is pending.
         """
-        return (self == OrderType.OP_BUYLIMIT or self == OrderType.OP_BUYSTOP or
-                self == OrderType.OP_SELLLIMIT or self == OrderType.OP_SELLSTOP)
+        return self._is_pending
 
     def __str__(self) -> str:
-        if self is OrderType.OP_BUY:
-            return "MARKET-BUY"
-        elif self is OrderType.OP_SELL:
-            return "MARKET-SELL"
-        elif self is OrderType.OP_BUYLIMIT:
-            return "LIMIT-BUY"
-        elif self is OrderType.OP_BUYSTOP:
-            return "STOP-BUY"
-        elif self is OrderType.OP_SELLLIMIT:
-            return "LIMIT-SELL"
-        elif self is OrderType.OP_SELLSTOP:
-            return "STOP-SELL"
-        elif self is OrderType.OP_BALANCE:
-            return "BALANCE"
-        elif self is OrderType.OP_CREDIT:
-            return "CREDIT"
-        elif self is OrderType.OP_REBATE:
-            return "REBATE"
-        else:
-            return "UNKNOWN"
+        return _ORDER_TYPE_NAMES.get(self, "UNKNOWN")
+
+
+_BUY_TYPES = frozenset((OrderType.OP_BUY, OrderType.OP_BUYLIMIT, OrderType.OP_BUYSTOP))
+_SELL_TYPES = frozenset((OrderType.OP_SELL, OrderType.OP_SELLLIMIT, OrderType.OP_SELLSTOP))
+_MARKET_TYPES = frozenset((OrderType.OP_BUY, OrderType.OP_SELL))
+_PENDING_TYPES = frozenset((OrderType.OP_BUYLIMIT, OrderType.OP_BUYSTOP, OrderType.OP_SELLLIMIT, OrderType.OP_SELLSTOP))
+_ORDER_TYPE_NAMES = {
+    OrderType.OP_BUY: "MARKET-BUY",
+    OrderType.OP_SELL: "MARKET-SELL",
+    OrderType.OP_BUYLIMIT: "LIMIT-BUY",
+    OrderType.OP_BUYSTOP: "STOP-BUY",
+    OrderType.OP_SELLLIMIT: "LIMIT-SELL",
+    OrderType.OP_SELLSTOP: "STOP-SELL",
+    OrderType.OP_BALANCE: "BALANCE",
+    OrderType.OP_CREDIT: "CREDIT",
+    OrderType.OP_REBATE: "REBATE",
+}
+
+_ORDER_TYPES = {order_type.value: order_type for order_type in OrderType}
+
+# bind the flags onto each member, so that the properties are a plain attribute load rather than a hash lookup
+for _member in OrderType:
+    _member._is_buy = _member in _BUY_TYPES
+    _member._is_sell = _member in _SELL_TYPES
+    _member._is_market = _member in _MARKET_TYPES
+    _member._is_pending = _member in _PENDING_TYPES
+del _member
 
 
 class Order:
@@ -80,6 +94,9 @@ class Order:
         https://docs.mql4.com/trading
     """
 
+    __slots__ = ("ticket", "magic_number", "symbol", "order_type", "lots", "open_price", "close_price", "open_time",
+                 "close_time", "expiration", "sl", "tp", "profit", "commission", "swap", "comment")
+
     def __init__(self, ticket: int, magic_number: int, symbol: str, order_type: int, lots: float,
                  open_price: float, close_price: float, open_time: str, close_time: str, expiration: str,
                  sl: float, tp: float, profit: float, commission: float, swap: float, comment: str):
@@ -92,7 +109,7 @@ class Order:
         self.symbol = symbol
         """The symbol name."""
 
-        self.order_type: OrderType = OrderType(order_type)
+        self.order_type: OrderType = _ORDER_TYPES[order_type]
         """The order type."""
 
         self.lots = lots
@@ -134,20 +151,24 @@ class Order:
         """The comment."""
 
     def __repr__(self):
-        return (f"{self.__class__.__name__}("
-                f"ticket={self.ticket}, "
-                f"magic_number={self.magic_number}, "
-                f"symbol={self.symbol}, "
-                f"order_type={self.order_type}, "
-                f"lots={self.lots}, "
-                f"open_price={self.open_price}, "
-                f"close_price={self.close_price}, "
-                f"open_time={self.open_time}, "
-                f"close_time={self.close_time}, "
-                f"expiration={self.expiration}, "
-                f"sl={self.sl}, "
-                f"tp={self.tp}, "
-                f"profit={self.profit}, "
-                f"commission={self.commission}, "
-                f"swap={self.swap}, "
-                f"comment={self.comment})")
+        return _ORDER_REPR % (self.__class__.__name__, *_ORDER_FIELDS(self))
+
+
+_ORDER_REPR = ("%s(ticket=%s, magic_number=%s, symbol=%s, order_type=%s, lots=%s, open_price=%s, close_price=%s, "
+               "open_time=%s, close_time=%s, expiration=%s, sl=%s, tp=%s, profit=%s, commission=%s, swap=%s, "
+               "comment=%s)")
+_ORDER_FIELDS = attrgetter("ticket", "magic_number", "symbol", "order_type", "lots", "open_price", "close_price",
+                           "open_time", "close_time", "expiration", "sl", "tp", "profit", "commission", "swap",
+                           "comment")
+
+# the fields of an order response, in the order of the `Order` constructor parameters
+_ORDER_VALUES = itemgetter("ticket", "magic_number", "symbol", "order_type", "lots", "open_price", "close_price",
+                           "open_time", "close_time", "expiration", "sl", "tp", "profit", "commission", "swap",
+                           "comment")
+
+ORDER_DTYPE = [("ticket", "i8"), ("magic_number", "i8"), ("symbol", "U32"), ("order_type", "i8"), ("lots", "f8"),
+               ("open_price", "f8"), ("close_price", "f8"), ("open_time", "U32"), ("close_time", "U32"),
+               ("expiration", "U32"), ("sl", "f8"), ("tp", "f8"), ("profit", "f8"), ("commission", "f8"),
+               ("swap", "f8")]
+"""The layout of an order in a NumPy structured array, for use with `numpy.dtype()`.  The free-text comment is
+omitted."""
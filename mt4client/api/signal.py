@@ -1,4 +1,6 @@
+from operator import attrgetter, itemgetter
 from mt4client.api import AccountTradeMode
+from mt4client.api.account import _TRADE_MODES
 
 
 class Signal:
@@ -10,6 +12,10 @@ class Signal:
         https://docs.mql4.com/constants/tradingconstants/signalproperties
     """
 
+    __slots__ = ("author_login", "broker", "broker_server", "name", "currency", "date_published", "date_started", "id",
+                 "leverage", "pips", "rating", "subscribers", "trades", "trade_mode", "balance", "equity", "gain",
+                 "max_drawdown", "price", "roi")
+
     def __init__(self, author_login: str, broker: str, broker_server: str, name: str,
                  currency: str, date_published: int, date_started: int, id: int, leverage: int, pips: int, rating: int,
                  subscribers: int, trades: int, trade_mode: int, balance: float, equity: float, gain: float,
@@ -53,7 +59,7 @@ class Signal:
         self.trades = trades
         """Number of trades."""
 
-        self.trade_mode: AccountTradeMode = AccountTradeMode(trade_mode)
+        self.trade_mode: AccountTradeMode = _TRADE_MODES[trade_mode]
         """Account type."""
 
         self.balance = balance
@@ -75,24 +81,17 @@ class Signal:
         """Return on investment (%)."""
 
     def __repr__(self):
-        return (f'{self.__class__.__name__}('
-                f'author_login={self.author_login}, '
-                f'broker={self.broker}, '
-                f'broker_server={self.broker_server}, '
-                f'name={self.name}, '
-                f'currency={self.currency}, '
-                f'date_published={self.date_published}, '
-                f'date_started={self.date_started}, '
-                f'id={self.id}, '
-                f'leverage={self.leverage}, '
-                f'pips={self.pips}, '
-                f'rating={self.rating}, '
-                f'subscribers={self.subscribers}, '
-                f'trades={self.trades}, '
-                f'trade_mode={self.trade_mode!r}, '
-                f'balance={self.balance}, '
-                f'equity={self.equity}, '
-                f'gain={self.gain}, '
-                f'max_drawdown={self.max_drawdown}, '
-                f'price={self.price}, '
-                f'roi={self.roi})')
+        return _SIGNAL_REPR % (self.__class__.__name__, *_SIGNAL_FIELDS(self))
+
+
+_SIGNAL_REPR = ("%s(author_login=%s, broker=%s, broker_server=%s, name=%s, currency=%s, date_published=%s, "
+                "date_started=%s, id=%s, leverage=%s, pips=%s, rating=%s, subscribers=%s, trades=%s, trade_mode=%r, "
+                "balance=%s, equity=%s, gain=%s, max_drawdown=%s, price=%s, roi=%s)")
+_SIGNAL_FIELDS = attrgetter("author_login", "broker", "broker_server", "name", "currency", "date_published",
+                            "date_started", "id", "leverage", "pips", "rating", "subscribers", "trades", "trade_mode",
+                            "balance", "equity", "gain", "max_drawdown", "price", "roi")
+
+# the fields of a signal response, in the order of the `Signal` constructor parameters
+_SIGNAL_VALUES = itemgetter("author_login", "broker", "broker_server", "name", "currency", "date_published",
+                            "date_started", "id", "leverage", "pips", "rating", "subscribers", "trades", "trade_mode",
+                            "balance", "equity", "gain", "max_drawdown", "price", "roi")
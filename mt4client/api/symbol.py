@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import sys
 from enum import Enum
-from typing import TYPE_CHECKING, Union, List
-from mt4client.api import StandardTimeframe, NonStandardTimeframe, parse_timeframe, OHLCV
+from functools import lru_cache
+from operator import itemgetter
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Tuple, Union, List
+from mt4client.api import StandardTimeframe, NonStandardTimeframe, parse_timeframe, OHLCV, OHLCV_DTYPE, \
+    drawdown
+from mt4client.api.chart import _to_array
 
 if TYPE_CHECKING:
+    import numpy
     from mt4client.client import MT4Client
 
+# the fields of an OHLCV bar response, in the order of the `OHLCV` constructor parameters
+_OHLCV_VALUES = itemgetter("open", "high", "low", "close", "tick_volume", "time")
+
+
+@lru_cache(maxsize=64)
+def _timeframe_period(timeframe: Union[str, StandardTimeframe, NonStandardTimeframe]) -> int:
+    return parse_timeframe(timeframe).value if isinstance(timeframe, str) else timeframe.value
+
 
 class MarketInfo(Enum):
     """MetaTrader 4 market information identifiers, used with MarketInfo() function.
@@ -51,6 +66,10 @@ class SymbolInfoInteger(Enum):
     References:
         https://docs.mql4.com/constants/environment_state/marketinfoconstants#enum_symbol_info_integer
     """
+    # set on each member below the class definitions; annotations are not enum members
+    _property_name: str
+    _is_static: bool
+
     SYMBOL_SELECT = 0
     SYMBOL_VISIBLE = 76
     SYMBOL_SESSION_DEALS = 56               # MQL5 only
@@ -83,6 +102,9 @@ class SymbolInfoDouble(Enum):
     References:
         https://docs.mql4.com/constants/environment_state/marketinfoconstants#enum_symbol_info_double
     """
+    _property_name: str
+    _is_static: bool
+
     SYMBOL_BID = 1
     SYMBOL_BIDHIGH = 2                      # MQL 5 only
     SYMBOL_BIDLOW = 3                       # MQL 5 only
@@ -194,6 +216,61 @@ class DayOfWeek(Enum):
     SATURDAY = 6
 
 
+_CALC_MODES = {mode.value: mode for mode in SymbolCalcMode}
+_TRADE_MODES = {mode.value: mode for mode in SymbolTradeMode}
+_TRADE_EXECUTIONS = {mode.value: mode for mode in SymbolTradeExecution}
+_SWAP_MODES = {mode.value: mode for mode in SymbolSwapMode}
+_DAYS_OF_WEEK = {day.value: day for day in DayOfWeek}
+
+# the properties exposed by `Symbol`, fetched together by default by `Symbol.refresh()`
+_PROPERTIES = (
+    SymbolInfoInteger.SYMBOL_SELECT,
+    SymbolInfoInteger.SYMBOL_VISIBLE,
+    SymbolInfoInteger.SYMBOL_TIME,
+    SymbolInfoInteger.SYMBOL_SPREAD_FLOAT,
+    SymbolInfoInteger.SYMBOL_SPREAD,
+    SymbolInfoInteger.SYMBOL_TRADE_CALC_MODE,
+    SymbolInfoInteger.SYMBOL_TRADE_MODE,
+    SymbolInfoInteger.SYMBOL_START_TIME,
+    SymbolInfoInteger.SYMBOL_EXPIRATION_TIME,
+    SymbolInfoInteger.SYMBOL_TRADE_EXEMODE,
+    SymbolInfoInteger.SYMBOL_SWAP_MODE,
+    SymbolInfoInteger.SYMBOL_SWAP_ROLLOVER3DAYS,
+    SymbolInfoDouble.SYMBOL_BID,
+    SymbolInfoDouble.SYMBOL_ASK,
+    SymbolInfoDouble.SYMBOL_SWAP_LONG,
+    SymbolInfoDouble.SYMBOL_SWAP_SHORT,
+    SymbolInfoDouble.SYMBOL_MARGIN_INITIAL,
+    SymbolInfoDouble.SYMBOL_MARGIN_MAINTENANCE,
+)
+
+# contract specifications which the broker does not change during a session, so they are cached until `invalidate()`
+_STATIC_PROPERTIES = frozenset({
+    SymbolInfoInteger.SYMBOL_DIGITS,
+    SymbolInfoInteger.SYMBOL_TRADE_CALC_MODE,
+    SymbolInfoInteger.SYMBOL_START_TIME,
+    SymbolInfoInteger.SYMBOL_EXPIRATION_TIME,
+    SymbolInfoInteger.SYMBOL_TRADE_EXEMODE,
+    SymbolInfoInteger.SYMBOL_SWAP_MODE,
+    SymbolInfoInteger.SYMBOL_SWAP_ROLLOVER3DAYS,
+    SymbolInfoDouble.SYMBOL_POINT,
+    SymbolInfoDouble.SYMBOL_TRADE_TICK_SIZE,
+    SymbolInfoDouble.SYMBOL_TRADE_CONTRACT_SIZE,
+    SymbolInfoDouble.SYMBOL_VOLUME_MIN,
+    SymbolInfoDouble.SYMBOL_VOLUME_MAX,
+    SymbolInfoDouble.SYMBOL_VOLUME_STEP,
+    SymbolInfoDouble.SYMBOL_MARGIN_INITIAL,
+    SymbolInfoDouble.SYMBOL_MARGIN_MAINTENANCE,
+})
+
+# bind the request property name and static flag onto each member, so that building a request or checking the cache is
+# a plain attribute load rather than a call through the `Enum.name` descriptor or a hash lookup
+for _member in (*SymbolInfoInteger, *SymbolInfoDouble):
+    _member._property_name = sys.intern(_member.name)
+    _member._is_static = _member in _STATIC_PROPERTIES
+del _member
+
+
 class SymbolTick:
     """The latest prices of a symbol in MetaTrader 4.
 
@@ -201,6 +278,8 @@ class SymbolTick:
         https://docs.mql4.com/constants/structures/mqltick
     """
 
+    __slots__ = ("time", "bid", "ask", "last", "volume")
+
     def __init__(self, time: int, bid: float, ask: float, last: float, volume: int):
         self.time = time
         """The time of the last prices update."""
@@ -226,6 +305,10 @@ class SymbolTick:
                 f"volume={self.volume})")
 
 
+# the fields of a tick response, in the order of the `SymbolTick` constructor parameters
+_TICK_VALUES = itemgetter("time", "bid", "ask", "last", "volume")
+
+
 class Symbol:
     """A market symbol in MetaTrader 4.
 
@@ -233,12 +316,20 @@ class Symbol:
         https://docs.mql4.com/constants/environment_state/marketinfoconstants
     """
 
+    __slots__ = ("_mt4", "_cache", "_tick", "_ttl", "name", "point", "digits", "volume_min", "volume_step",
+                 "volume_max", "trade_contract_size", "trade_tick_value", "trade_tick_size", "trade_stops_level",
+                 "trade_freeze_level")
+
     def __init__(self, mt4: MT4Client, name: str, point: float, digits: int, volume_min: float,
                  volume_step: float, volume_max: float, trade_contract_size: float, trade_tick_value: float,
-                 trade_tick_size: float, trade_stops_level: int, trade_freeze_level: int):
+                 trade_tick_size: float, trade_stops_level: int, trade_freeze_level: int, cache_ttl: float = 0):
         self._mt4 = mt4
 
-        self.name = name
+        self._cache: Dict[Union[SymbolInfoInteger, SymbolInfoDouble], Tuple[float, Any]] = {}
+        self._tick: Optional[Tuple[float, SymbolTick]] = None
+        self._ttl = cache_ttl
+
+        self.name = sys.intern(name)
         """Symbol name."""
 
         self.point = point
@@ -282,15 +373,42 @@ class Symbol:
         :return:            A list of OHLCV bars, sorted oldest-to-newest, each having the following structure:
                             [time, open, high, low, close, volume]
         """
-        period = parse_timeframe(timeframe).value if isinstance(timeframe, str) else timeframe.value
-        bars = self._mt4._get_response(request={
+        return [OHLCV(*_OHLCV_VALUES(bar)) for bar in self._get_ohlcv(timeframe, limit, timeout)]
+
+    def ohlcv_array(self, timeframe: Union[str, StandardTimeframe, NonStandardTimeframe], limit: int = 100,
+                    timeout: int = 5000) -> numpy.ndarray:
+        """
+        Fetches OHLCV data for this symbol, up to the current time, as a NumPy structured array.  Requires NumPy.
+
+        :param timeframe:   The period.  Use a standard timeframe for a higher likelihood of success.
+        :param limit:       The maximum number of bars to get.
+        :param timeout:     The maximum milliseconds to wait for the broker's server to provide the requested data.
+        :return:            An array of OHLCV bars, sorted oldest-to-newest, with the fields of `OHLCV_DTYPE`.
+        """
+        return _to_array(self._get_ohlcv(timeframe, limit, timeout), OHLCV_DTYPE)
+
+    def max_drawdown(self, timeframe: Union[str, StandardTimeframe, NonStandardTimeframe], limit: int = 100,
+                     timeout: int = 5000) -> float:
+        """
+        Computes the maximum drawdown of this symbol's closing prices, up to the current time.  Requires NumPy.
+
+        :param timeframe:   The period.  Use a standard timeframe for a higher likelihood of success.
+        :param limit:       The maximum number of bars to use.
+        :param timeout:     The maximum milliseconds to wait for the broker's server to provide the requested data.
+        :return:            The largest fractional fall from a running peak close, as a value <= 0.
+        """
+        bars = self.ohlcv_array(timeframe, limit, timeout)
+        return float(drawdown(bars["close"]).min()) if len(bars) else 0.0
+
+    def _get_ohlcv(self, timeframe: Union[str, StandardTimeframe, NonStandardTimeframe], limit: int,
+                   timeout: int) -> List[Dict[str, Any]]:
+        return self._mt4._get_response(request={
             "action": "GET_OHLCV",
             "symbol": self.name,
-            "timeframe": period,
+            "timeframe": _timeframe_period(timeframe),
             "limit": limit,
             "timeout": timeout
-        }, default=[])
-        return [OHLCV(**bar) for bar in bars]
+        }, default=[], copy=False)
 
     @property
     def tick(self) -> SymbolTick:
@@ -300,13 +418,20 @@ class Symbol:
         References:
             https://docs.mql4.com/constants/structures/mqltick
 
-        :return:    The latest symbol tick.
+        :return:    The latest symbol tick.  With a non-zero `cache_ttl`, a tick fetched less than `cache_ttl` seconds
+                    ago is reused.
         """
+        now = monotonic()
+        cached = self._tick
+        if cached is not None and now - cached[0] < self._ttl:
+            return cached[1]
         resp = self._mt4._get_response(request={
             "action": "GET_SYMBOL_TICK",
             "symbol": self.name
         })
-        return SymbolTick(**resp)
+        tick = SymbolTick(*_TICK_VALUES(resp))
+        self._tick = (now, tick)
+        return tick
 
     @property
     def is_selected(self) -> bool:
@@ -361,7 +486,7 @@ class Symbol:
         :return:    `SymbolInfoInteger(:symbol, SYMBOL_TRADE_CALC_MODE)`
         """
         val = self._get_symbol_info_integer(SymbolInfoInteger.SYMBOL_TRADE_CALC_MODE)
-        return SymbolCalcMode(val)
+        return _CALC_MODES[val]
 
     @property
     def trade_mode(self) -> SymbolTradeMode:
@@ -370,7 +495,7 @@ class Symbol:
         :return:    `SymbolInfoInteger(:symbol, SYMBOL_TRADE_MODE)`
         """
         val = self._get_symbol_info_integer(SymbolInfoInteger.SYMBOL_TRADE_MODE)
-        return SymbolTradeMode(val)
+        return _TRADE_MODES[val]
 
     @property
     def start_time(self) -> int:
@@ -395,7 +520,7 @@ class Symbol:
         :return:    `SymbolInfoInteger(:symbol, SYMBOL_TRADE_EXEMODE)`
         """
         val = self._get_symbol_info_integer(SymbolInfoInteger.SYMBOL_TRADE_EXEMODE)
-        return SymbolTradeExecution(val)
+        return _TRADE_EXECUTIONS[val]
 
     @property
     def swap_mode(self) -> SymbolSwapMode:
@@ -404,7 +529,7 @@ class Symbol:
         :return:    `SymbolInfoInteger(:symbol, SYMBOL_SWAP_MODE)`
         """
         val = self._get_symbol_info_integer(SymbolInfoInteger.SYMBOL_SWAP_MODE)
-        return SymbolSwapMode(val)
+        return _SWAP_MODES[val]
 
     @property
     def swap_rollover3days(self) -> DayOfWeek:
@@ -413,7 +538,7 @@ class Symbol:
         :return:    `SymbolInfoInteger(:symbol, SYMBOL_SWAP_ROLLOVER3DAYS)`
         """
         val = self._get_symbol_info_integer(SymbolInfoInteger.SYMBOL_SWAP_ROLLOVER3DAYS)
-        return DayOfWeek(val)
+        return _DAYS_OF_WEEK[val]
 
     @property
     def bid(self) -> float:
@@ -466,19 +591,59 @@ class Symbol:
         """
         return self._get_symbol_info_double(SymbolInfoDouble.SYMBOL_MARGIN_MAINTENANCE)
 
-    def _get_symbol_info_integer(self, prop: SymbolInfoInteger) -> Union[bool, int]:
-        return self._mt4._get_response(request={
-            "action": "GET_SYMBOL_INFO_INTEGER",
+    def refresh(self, props: Iterable[Union[SymbolInfoInteger, SymbolInfoDouble]] = None) \
+            -> Dict[Union[SymbolInfoInteger, SymbolInfoDouble], Any]:
+        """
+        Fetch several symbol properties at once, filling the cache.
+
+        :param props:   The properties to fetch.  Defaults to all of the properties exposed by this class.
+        :return:        The raw fetched values, keyed by property.
+        """
+        props = _PROPERTIES if props is None else tuple(props)
+        now = monotonic()
+        values = self._mt4._get_responses([{
+            "action": "GET_SYMBOL_INFO_INTEGER" if isinstance(prop, SymbolInfoInteger) else "GET_SYMBOL_INFO_DOUBLE",
             "symbol": self.name,
-            "property_name": prop.name
-        })
+            "property_name": prop._property_name
+        } for prop in props])
+        for prop, val in zip(props, values):
+            self._cache[prop] = (now, val)
+        return dict(zip(props, values))
+
+    def invalidate(self):
+        """
+        Discard all cached property values and the cached tick, including the contract specifications which are
+        otherwise kept for the lifetime of this object.
+        """
+        self._cache.clear()
+        self._tick = None
+
+    def _get_symbol_info_integer(self, prop: SymbolInfoInteger) -> Union[bool, int]:
+        return self._get_symbol_info("GET_SYMBOL_INFO_INTEGER", prop)
 
     def _get_symbol_info_double(self, prop: SymbolInfoDouble) -> float:
-        return self._mt4._get_response(request={
-            "action": "GET_SYMBOL_INFO_DOUBLE",
+        return self._get_symbol_info("GET_SYMBOL_INFO_DOUBLE", prop)
+
+    def _get_symbol_info(self, action: str, prop: Union[SymbolInfoInteger, SymbolInfoDouble]) -> Any:
+        """
+        Get a symbol property, reusing the last value if it was fetched less than `cache_ttl` seconds ago, or at any
+        time since the last `invalidate()` for a static contract specification.
+
+        :param action:  The request action.
+        :param prop:    The symbol property.
+        :return:        The property value.
+        """
+        now = monotonic()
+        cached = self._cache.get(prop)
+        if cached is not None and (prop._is_static or now - cached[0] < self._ttl):
+            return cached[1]
+        val = self._mt4._get_response(request={
+            "action": action,
             "symbol": self.name,
-            "property_name": prop.name
+            "property_name": prop._property_name
         })
+        self._cache[prop] = (now, val)
+        return val
 
     def __repr__(self):
         return (f'{self.__class__.__name__}('
@@ -493,3 +658,11 @@ class Symbol:
                 f'trade_tick_size={self.trade_tick_size}, '
                 f'trade_stops_level={self.trade_stops_level}, '
                 f'trade_freeze_level={self.trade_freeze_level})')
+
+
+# the fields of a symbol info response, in the order of the `Symbol` constructor parameters following `mt4`; typed as a
+# fixed-length tuple so that type checkers accept the `cache_ttl` keyword after it
+_SymbolValues = Tuple[str, float, int, float, float, float, float, float, float, int, int]
+_SYMBOL_VALUES: Callable[[Dict[str, Any]], _SymbolValues] = \
+    itemgetter("name", "point", "digits", "volume_min", "volume_step", "volume_max", "trade_contract_size",
+               "trade_tick_value", "trade_tick_size", "trade_stops_level", "trade_freeze_level")
@@ -1,48 +1,70 @@
+import json
 import zmq
 
-from typing import Any, Dict, List, Union
-from mt4client.api import Account, MT4Error, Signal, Symbol, Order, OrderType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+from mt4client.api import Account, MT4Error, Signal, Symbol, SymbolTick, Order, OrderType, ORDER_DTYPE
+from mt4client.api.chart import _to_array
+from mt4client.api.order import _ORDER_VALUES
+from mt4client.api.signal import _SIGNAL_VALUES
+from mt4client.api.symbol import _SYMBOL_VALUES, _TICK_VALUES
+
+if TYPE_CHECKING:
+    import numpy
+
+try:
+    import orjson
+
+    def _json_loads(data: Union[bytes, memoryview]) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data: Union[bytes, memoryview]) -> Any:
+        # stdlib json does not accept a memoryview; bytes() of a bytes object is a no-op
+        return json.loads(bytes(data))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    # the same bytes as pyzmq's `send_json()`, ie. with non-ASCII characters escaped, which the server is known to read
+    return json.dumps(obj).encode("utf8")
 
 
 class MT4Client:
     """Client interface for the MetaTrader 4 Server."""
 
     def __init__(self, address: str = "tcp://localhost:28282", request_timeout_ms: int = 10000,
-                 response_timeout_ms: int = 10000, verbose: bool = False):
+                 response_timeout_ms: int = 10000, verbose: bool = False, context: zmq.Context = None):
         """
-        Constructor.  Initialize the REQ socket and connect to the MT4 server.
+        Constructor.  Initialize the DEALER socket and connect to the MT4 server.
 
         :param address:             The address of the server's listening socket.
         :param request_timeout_ms:  The number of milliseconds to wait for a request to be sent.
         :param response_timeout_ms: The number of milliseconds to wait for a response to be received.
         :param verbose:             Whether to print trace messages.
+        :param context:             The ZeroMQ context in which to create the socket.  Defaults to the process-wide
+                                    shared context, so that multiple clients share its I/O thread.
         """
         self._verbose = verbose
-
-        # create and configure REQ socket
-        self._context = zmq.Context()
-        self._socket = self._context.socket(zmq.REQ)
-        self._socket.setsockopt(zmq.SNDHWM, 1)
-        self._socket.setsockopt(zmq.RCVHWM, 1)
-        self._socket.setsockopt(zmq.SNDTIMEO, request_timeout_ms)
-        self._socket.setsockopt(zmq.RCVTIMEO, response_timeout_ms)
-
-        # connect to server
-        self._socket.connect(address)
+        self._address = address
+        self._request_timeout_ms = request_timeout_ms
+        self._response_timeout_ms = response_timeout_ms
+        self._context = context if context is not None else zmq.Context.instance()
+        self._connect()
 
     def shutdown(self):
-        """Close all sockets immediately and terminate the ZeroMQ context."""
+        """Close the socket immediately.  The ZeroMQ context is left open for any other clients sharing it."""
         self._print_trace("Disconnecting...")
-        self._context.destroy(0)
+        self._socket.close(0)
 
-    def account(self) -> Account:
+    def account(self, cache_ttl: float = 0) -> Account:
         """
         Get a query interface for the account details.
 
-        :return:    The account object.
+        :param cache_ttl:   The number of seconds for which a fetched account property is reused rather than requested
+                            again.  Disabled by default, as balance, equity and margin change with every trade.
+        :return:            The account object.
         """
         resp = self._get_response(request={"action": "GET_ACCOUNT_INFO"})
-        return Account(mt4=self, **resp)
+        return Account(self, resp["login"], resp["trade_mode"], resp["name"], resp["server"], resp["currency"],
+                       resp["company"], cache_ttl)
 
     def symbol_names(self) -> List[str]:
         """
@@ -50,33 +72,51 @@ class MT4Client:
 
         :return:    A list of symbol names.
         """
-        return self._get_response(request={"action": "GET_SYMBOLS"}, default=[])
+        return self._get_response(request={"action": "GET_SYMBOLS"}, default=[], copy=False)
 
-    def symbols(self, *names: str) -> Dict[str, Symbol]:
+    def symbols(self, *names: str, cache_ttl: float = 0) -> Dict[str, Symbol]:
         """
         Get query interfaces for market symbols.
 
-        :param names:   The names of the symbols.
-        :return:        A name-to-symbol dict of symbol objects.
+        :param names:       The names of the symbols.
+        :param cache_ttl:   The number of seconds for which a fetched tick or market property is reused rather than
+                            requested again.  Disabled by default.  Contract specifications are always cached.
+        :return:            A name-to-symbol dict of symbol objects.
         """
         resp = self._get_response(request={
             "action": "GET_SYMBOL_INFO",
             "names": names
-        })
-        return {name: Symbol(mt4=self, **resp[name]) for name in names}
+        }, copy=False)
+        return {name: Symbol(self, *_SYMBOL_VALUES(resp[name]), cache_ttl=cache_ttl) for name in names}
 
-    def symbol(self, name: str) -> Symbol:
+    def symbol(self, name: str, cache_ttl: float = 0) -> Symbol:
         """
         Get a query interface for a market symbol.
 
-        :param name:    The name of the symbol.
-        :return:        The symbol object.
+        :param name:        The name of the symbol.
+        :param cache_ttl:   The number of seconds for which a fetched tick or market property is reused rather than
+                            requested again.  Disabled by default.  Contract specifications are always cached.
+        :return:            The symbol object.
         """
         resp = self._get_response(request={
             "action": "GET_SYMBOL_INFO",
             "names": [name]
         })
-        return Symbol(mt4=self, **resp[name])
+        return Symbol(self, *_SYMBOL_VALUES(resp[name]), cache_ttl=cache_ttl)
+
+    def ticks(self, *symbols: Union[Symbol, str]) -> Dict[str, SymbolTick]:
+        """
+        Get the latest market prices of several symbols at once.
+
+        :param symbols: The symbols or their names.
+        :return:        A name-to-tick dict of symbol ticks.
+        """
+        names = [symbol.name if isinstance(symbol, Symbol) else symbol for symbol in symbols]
+        resps = self._get_responses([{
+            "action": "GET_SYMBOL_TICK",
+            "symbol": name
+        } for name in names])
+        return {name: SymbolTick(*_TICK_VALUES(resp)) for name, resp in zip(names, resps)}
 
     def signal_names(self) -> List[str]:
         """
@@ -84,7 +124,7 @@ class MT4Client:
 
         :return:    A list of names of the available signals.
         """
-        return self._get_response(request={"action": "GET_SIGNALS"}, default=[])
+        return self._get_response(request={"action": "GET_SIGNALS"}, default=[], copy=False)
 
     def signals(self, *names: str) -> Dict[str, Signal]:
         """
@@ -96,8 +136,8 @@ class MT4Client:
         resp = self._get_response(request={
             "action": "GET_SIGNAL_INFO",
             "names": names
-        }, default={})
-        return {name: Signal(**resp[name]) for name in names}
+        }, default={}, copy=False)
+        return {name: Signal(*_SIGNAL_VALUES(resp[name])) for name in names}
 
     def signal(self, name: str) -> Signal:
         """
@@ -110,7 +150,7 @@ class MT4Client:
             "action": "GET_SIGNAL_INFO",
             "names": [name]
         }, default={})
-        return Signal(**resp[name])
+        return Signal(*_SIGNAL_VALUES(resp[name]))
 
     def indicator(self, func: str, args: List[Union[str, int, float]], timeout: int = 5000) -> float:
         """
@@ -139,8 +179,8 @@ class MT4Client:
         """
         resp = self._get_response(request={
             "action": "GET_ORDERS"
-        }, default=[])
-        return [Order(**order_dict) for order_dict in resp]
+        }, default=[], copy=False)
+        return [Order(*_ORDER_VALUES(order_dict)) for order_dict in resp]
 
     def orders_historical(self) -> List[Order]:
         """
@@ -150,8 +190,19 @@ class MT4Client:
         """
         resp = self._get_response(request={
             "action": "GET_HISTORICAL_ORDERS"
-        }, default=[])
-        return [Order(**order_dict) for order_dict in resp]
+        }, default=[], copy=False)
+        return [Order(*_ORDER_VALUES(order_dict)) for order_dict in resp]
+
+    def orders_historical_array(self) -> "numpy.ndarray":
+        """
+        Get the deleted and closed orders from the Account History tab, as a NumPy structured array.  Requires NumPy.
+
+        :return:    An array of closed orders, with the fields of `ORDER_DTYPE`.
+        """
+        resp = self._get_response(request={
+            "action": "GET_HISTORICAL_ORDERS"
+        }, default=[], copy=False)
+        return _to_array(resp, ORDER_DTYPE)
 
     def order(self, ticket: int) -> Order:
         """
@@ -164,7 +215,7 @@ class MT4Client:
             "action": "GET_ORDER",
             "ticket": ticket
         })
-        return Order(**resp)
+        return Order(*_ORDER_VALUES(resp))
 
     def order_send(self, symbol: Union[Symbol, str], order_type: OrderType, lots: float, price: float = None,
                    slippage: int = None, sl: float = None, tp: float = None, sl_points: int = None,
@@ -189,10 +240,12 @@ class MT4Client:
         :param comment:         The order comment text.  Last part of the comment may be changed by server.  Optional.
         :return:                The new Order.
         """
-        if not order_type.is_buy and not order_type.is_sell:
+        # every buy or sell type is exactly one of market or pending
+        if order_type.is_pending:
+            if price is None:
+                raise ValueError("Pending orders must specify a price")
+        elif not order_type.is_market:
             raise ValueError("Invalid order type: " + str(order_type))
-        if order_type.is_pending and price is None:
-            raise ValueError("Pending orders must specify a price")
         resp = self._get_response(request={
             "action": "DO_ORDER_SEND",
             "symbol": symbol.name if isinstance(symbol, Symbol) else symbol,
@@ -206,7 +259,7 @@ class MT4Client:
             "tp_points": tp_points,
             "comment": comment
         })
-        return Order(**resp)
+        return Order(*_ORDER_VALUES(resp))
 
     def order_modify(self, order: Union[Order, int], price: float = None, sl: float = None, tp: float = None,
                      sl_points: int = None, tp_points: int = None) -> Order:
@@ -235,7 +288,7 @@ class MT4Client:
             "sl_points": sl_points,
             "tp_points": tp_points
         })
-        return Order(**resp)
+        return Order(*_ORDER_VALUES(resp))
 
     def order_close(self, order: Union[Order, int]):
         """
@@ -272,34 +325,147 @@ class MT4Client:
             "ticket": order.ticket if isinstance(order, Order) else order
         })
 
-    def _get_response(self, request: Dict[str, Any], default: Any = None) -> Any:
+    def orders_close(self, orders: Iterable[Union[Order, int]]) -> Dict[int, Optional[MT4Error]]:
+        """
+        Close several open orders at once, without raising if any of them fail.
+
+        :param orders:  The orders to close or their ticket numbers.
+        :return:        A ticket-to-result dict, where the result is None if the order was closed, otherwise the error.
+        """
+        tickets = [order.ticket if isinstance(order, Order) else order for order in orders]
+        return self._get_results(tickets, [{
+            "action": "DO_ORDER_CLOSE",
+            "ticket": ticket
+        } for ticket in tickets])
+
+    def orders_delete(self, orders: Iterable[Union[Order, int]], close_if_opened: bool = False) \
+            -> Dict[int, Optional[MT4Error]]:
+        """
+        Delete several pending orders at once, without raising if any of them fail.
+
+        :param orders:          The orders to delete or their ticket numbers.
+        :param close_if_opened: If true, any open orders are closed at market price.  If false, an `ERR_INVALID_TICKET`
+                                error is returned for any open orders.
+        :return:                A ticket-to-result dict, where the result is None if the order was deleted, otherwise
+                                the error.
+        """
+        tickets = [order.ticket if isinstance(order, Order) else order for order in orders]
+        return self._get_results(tickets, [{
+            "action": "DO_ORDER_DELETE",
+            "close_if_opened": close_if_opened,
+            "ticket": ticket
+        } for ticket in tickets])
+
+    def _connect(self):
+        """Create the DEALER socket and connect it to the server."""
+        self._socket = self._context.socket(zmq.DEALER)
+        self._socket.setsockopt(zmq.SNDTIMEO, self._request_timeout_ms)
+        self._socket.setsockopt(zmq.RCVTIMEO, self._response_timeout_ms)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        self._socket.setsockopt(zmq.IMMEDIATE, 1)
+        # detect a silently dropped connection to the terminal during long idle periods
+        self._socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+        self._socket.setsockopt(zmq.TCP_KEEPALIVE_IDLE, 30)
+        self._socket.connect(self._address)
+
+    def _get_response(self, request: Dict[str, Any], default: Any = None, copy: bool = True) -> Any:
         """
         Send a request object to the server and wait for a response.
 
         :param request:         The request to send.  Must have an `action` property.
         :param default:         The default return value.
+        :param copy:            Whether to copy the response out of the ZeroMQ message before parsing it.  Pass False
+                                for potentially large responses, which are then parsed in place.
         :return:                The server response or the default value if response is empty.
         :raises:                zmq.ZMQError, MT4Error
         """
-        self._socket.send_json(request)
-        self._print_trace(f"Request:  {request}")
-        resp = self._socket.recv_json()
-        if resp is None:
-            self._print_trace("Response is empty.")
-        else:
-            self._print_trace(f"Response: {resp}")
-
-        # raise any errors
-        error_code = resp.get("error_code")
-        error_code_description = resp.get("error_code_description")
-        error_message = resp.get("error_message")
-        if not (error_code is None and error_code_description is None and error_message is None):
-            raise MT4Error(error_code, error_code_description, error_message)
+        return self._get_responses([request], default, copy)[0]
+
+    def _get_responses(self, requests: List[Dict[str, Any]], default: Any = None, copy: bool = True) -> List[Any]:
+        """
+        Send several request objects to the server in a single pipelined exchange, ie. back-to-back before waiting
+        for any of the responses.  The server answers the requests in the order they were sent, so this costs roughly
+        one round-trip instead of one per request.
+
+        :param requests:        The requests to send.  Each must have an `action` property.
+        :param default:         The default return value of each request.
+        :param copy:            Whether to copy the responses out of the ZeroMQ messages before parsing them.
+        :return:                The server responses, in request order, or the default value for any empty response.
+        :raises:                zmq.ZMQError, MT4Error
+        """
+        return [self._unwrap_response(resp, default) for resp in self._exchange(requests, copy)]
+
+    def _get_results(self, tickets: List[int], requests: List[Dict[str, Any]]) -> Dict[int, Optional[MT4Error]]:
+        """
+        Send several order action requests to the server back-to-back, then collect the outcome of each without
+        raising.
+
+        :param tickets:         The ticket number of each request.
+        :param requests:        The requests to send.  Each must have an `action` property.
+        :return:                A ticket-to-result dict, where the result is None on success, otherwise the error.
+        :raises:                zmq.ZMQError
+        """
+        results: Dict[int, Optional[MT4Error]] = {}
+        for ticket, resp in zip(tickets, self._exchange(requests)):
+            try:
+                self._unwrap_response(resp, None)
+                results[ticket] = None
+            except MT4Error as ex:
+                results[ticket] = ex
+        return results
+
+    def _exchange(self, requests: List[Dict[str, Any]], copy: bool = True) -> List[Any]:
+        """
+        Send several request objects to the server back-to-back, then receive the raw responses.
+
+        :param requests:        The requests to send.  Each must have an `action` property.
+        :param copy:            Whether to copy the responses out of the ZeroMQ messages before parsing them.
+        :return:                The decoded, but not yet unwrapped, server responses in request order.
+        :raises:                zmq.ZMQError
+        """
+        verbose = self._verbose
+        try:
+            for request in requests:
+                # empty delimiter frame, as expected by the server's REP socket
+                self._socket.send_multipart((b"", _json_dumps(request)))
+                if verbose:
+                    self._print_trace(f"Request:  {request}")
+            if copy:
+                resps = [_json_loads(self._socket.recv_multipart()[-1]) for _ in requests]
+            else:
+                resps = [_json_loads(self._socket.recv_multipart(copy=False)[-1].buffer) for _ in requests]
+        except BaseException:
+            # replies still in flight would be mistaken for the responses to the next requests, so start over
+            self._socket.close(0)
+            self._connect()
+            raise
+        return resps
+
+    def _unwrap_response(self, resp: Any, default: Any) -> Any:
+        """
+        Raise any error contained in a server response, otherwise unwrap it.
+
+        :param resp:            The server response.
+        :param default:         The default return value.
+        :return:                The unwrapped response or the default value if response is empty.
+        :raises:                MT4Error
+        """
+        if self._verbose:
+            self._print_trace("Response is empty." if resp is None else f"Response: {resp}")
+
+        # raise any errors; successful responses carry none of the error keys, so test membership before fetching them
+        if "error_code" in resp or "error_code_description" in resp or "error_message" in resp:
+            error_code = resp.get("error_code")
+            error_code_description = resp.get("error_code_description")
+            error_message = resp.get("error_message")
+            if not (error_code is None and error_code_description is None and error_message is None):
+                raise MT4Error(error_code, error_code_description, error_message)
 
         # print any warnings to STDOUT
-        warning_message = resp.get("warning")
-        if warning_message is not None:
-            print(str(warning_message))
+        if "warning" in resp:
+            warning_message = resp["warning"]
+            if warning_message is not None:
+                print(str(warning_message))
 
         # unwrap the response
         return resp.get("response", default)
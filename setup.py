@@ -1,3 +1,15 @@
+import os
 from setuptools import setup, find_packages
 
-setup(name="mt4client", packages=find_packages())
+ext_modules = []
+if os.environ.get("MT4CLIENT_USE_MYPYC") == "1":
+    # optionally compile the hot, fully-annotated API modules to C extensions
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        raise SystemExit("MT4CLIENT_USE_MYPYC=1 requires mypy in the build environment: "
+                         "pip install mypy && MT4CLIENT_USE_MYPYC=1 pip install --no-build-isolation .")
+    ext_modules = mypycify(["--follow-imports=silent", "mt4client/api/chart.py", "mt4client/api/account.py"])
+
+setup(name="mt4client", packages=find_packages(), ext_modules=ext_modules,
+      extras_require={"fast": ["orjson"], "numpy": ["numpy"]})
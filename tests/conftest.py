@@ -1,10 +1,17 @@
 """Pytest config for integration tests."""
 
 import pytest
+from typing import List
+
 from mt4client import MT4Client
 from mt4client.api import Symbol
 
 
+def pytest_configure(config):
+    # deselect with: pytest -m "not slow"
+    config.addinivalue_line("markers", "slow: tests that send, modify or close orders on the broker")
+
+
 @pytest.fixture(scope="session", autouse=True)
 def mt4() -> MT4Client:
     mt4 = MT4Client(address="tcp://win10:28282", verbose=False)
@@ -20,3 +27,21 @@ def symbol_name() -> str:
 @pytest.fixture(scope="session")
 def symbol(mt4: MT4Client, symbol_name: str) -> Symbol:
     return mt4.symbol(symbol_name)
+
+
+@pytest.fixture(scope="session")
+def symbol_names(mt4: MT4Client) -> List[str]:
+    return mt4.symbol_names()
+
+
+@pytest.fixture(scope="session")
+def signal_names(mt4: MT4Client) -> List[str]:
+    return mt4.signal_names()
+
+
+@pytest.fixture(scope="session")
+def orders_guard(mt4: MT4Client):
+    # close/delete any orders opened during the session, even if a test failed before cleaning up
+    baseline = {order.ticket for order in mt4.orders()}
+    yield
+    mt4.orders_delete([order for order in mt4.orders() if order.ticket not in baseline], close_if_opened=True)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from mt4client.api import Account, AccountTradeMode, AccountStopoutMode
+from mt4client.api import Account, AccountInfoDouble, AccountTradeMode, AccountStopoutMode
 from mt4client import MT4Client
 
 
@@ -107,6 +107,13 @@ def test_account_margin_stopout_level(account: Account):
     print(f"Account margin_stopout_level: {val}")
 
 
+def test_account_refresh(account: Account):
+    values = account.refresh()
+    val = values[AccountInfoDouble.ACCOUNT_EQUITY]
+    assert isinstance(val, float)
+    print(f"Account equity after refresh: {val}")
+
+
 def test_account_name(account: Account):
     val = account.name
     assert isinstance(val, str)
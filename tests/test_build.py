@@ -0,0 +1,17 @@
+"""Checks that the modules compiled by the optional mypyc build still type-check."""
+
+import os
+
+import pytest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the modules passed to `mypycify()` in setup.py
+_MYPYC_MODULES = ["mt4client/api/chart.py", "mt4client/api/account.py"]
+
+
+def test_mypyc_modules_type_check():
+    api = pytest.importorskip("mypy.api")
+    stdout, stderr, status = api.run(["--follow-imports=silent", "--no-incremental",
+                                      *(os.path.join(_ROOT, module) for module in _MYPYC_MODULES)])
+    assert status == 0, stdout + stderr
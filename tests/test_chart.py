@@ -1,6 +1,8 @@
 """Unit tests for chart-related functions."""
 
-from mt4client.api import parse_timeframe, StandardTimeframe, NonStandardTimeframe
+import pytest
+
+from mt4client.api import parse_timeframe, StandardTimeframe, NonStandardTimeframe, OHLCV_DTYPE, drawdown, resample
 
 
 def test_parse_timeframe():
@@ -13,3 +15,29 @@ def test_parse_timeframe():
     assert parse_timeframe("2m") == NonStandardTimeframe.PERIOD_M2
     assert parse_timeframe("2h") == NonStandardTimeframe.PERIOD_H2
 
+
+def test_parse_timeframe_invalid():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse_timeframe("7q")
+
+
+def test_drawdown():
+    np = pytest.importorskip("numpy")
+    dd = drawdown(np.array([1.0, 2.0, 1.5, 3.0, 1.5]))
+    assert np.allclose(dd, [0.0, 0.0, -0.25, 0.0, -0.5])
+
+
+def test_resample():
+    np = pytest.importorskip("numpy")
+    bars = np.array([
+        (1.0, 2.0, 0.5, 1.5, 10, 0),
+        (1.5, 3.0, 1.0, 2.5, 20, 60),
+        (2.5, 2.6, 2.0, 2.1, 30, 120),
+    ], dtype=OHLCV_DTYPE)
+    m2 = resample(bars, "2m")
+    assert m2.tolist() == [(1.0, 3.0, 0.5, 2.5, 30, 0), (2.5, 2.6, 2.0, 2.1, 30, 120)]
+    with pytest.raises(ValueError):
+        resample(bars, "1w")
+    with pytest.raises(ValueError):
+        resample(m2, "3m")
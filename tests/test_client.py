@@ -0,0 +1,81 @@
+"""Unit tests of the client transport, against a local stand-in for the server's REP socket."""
+
+import threading
+import time
+
+import pytest
+import zmq
+
+from mt4client import MT4Client
+from mt4client.api import MT4Error
+
+
+def _handle(request: dict) -> dict:
+    action = request["action"]
+    if action == "GET_SYMBOL_TICK":
+        # tag each tick with its symbol, so that a reply matched to the wrong request is detectable
+        return {"response": {"time": 0, "bid": float(len(request["symbol"])), "ask": 0.0, "last": 0.0, "volume": 0,
+                             "symbol": request["symbol"]}}
+    if action == "DO_ORDER_CLOSE":
+        if request["ticket"] < 0:
+            return {"error_code": 4108, "error_code_description": "invalid ticket", "error_message": "no such order"}
+        return {}
+    if action == "SLEEP":
+        time.sleep(request["seconds"])
+        return {"response": "late"}
+    return {"response": request.get("value")}
+
+
+@pytest.fixture
+def server():
+    context = zmq.Context()
+    socket = context.socket(zmq.REP)
+    port = socket.bind_to_random_port("tcp://127.0.0.1")
+    stopped = threading.Event()
+
+    def serve():
+        while not stopped.is_set():
+            if socket.poll(50):
+                socket.send_json(_handle(socket.recv_json()))
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield context, f"tcp://127.0.0.1:{port}"
+    stopped.set()
+    thread.join()
+    socket.close(0)
+    context.term()
+
+
+@pytest.fixture
+def client(server) -> MT4Client:
+    context, address = server
+    mt4 = MT4Client(address=address, response_timeout_ms=500, context=context)
+    yield mt4
+    mt4.shutdown()
+
+
+def test_batch_replies_in_request_order(client: MT4Client):
+    names = ["A", "BB", "CCC", "DDDD"]
+    ticks = client.ticks(*names)
+    assert list(ticks) == names
+    assert [tick.bid for tick in ticks.values()] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_timeout_discards_stale_reply(client: MT4Client):
+    with pytest.raises(zmq.Again):
+        client._get_response({"action": "SLEEP", "seconds": 1})
+    # the late reply to the timed-out request must not be taken as the reply to this one
+    time.sleep(1)
+    assert client._get_response({"action": "ECHO", "value": "fresh"}) == "fresh"
+
+
+def test_error_in_batch(client: MT4Client):
+    results = client.orders_close([1, -2, 3])
+    assert results[1] is None and results[3] is None
+    assert isinstance(results[-2], MT4Error)
+
+    with pytest.raises(MT4Error):
+        client._get_responses([{"action": "DO_ORDER_CLOSE", "ticket": ticket} for ticket in (1, -2, 3)])
+    # the remaining replies of the failed batch were consumed, so the next exchange is still in step
+    assert client._get_response({"action": "ECHO", "value": "next"}) == "next"
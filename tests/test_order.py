@@ -1,7 +1,12 @@
+import pytest
+
 from mt4client import MT4Client
-from mt4client.api import Symbol, Order, OrderType
+from mt4client.api import Symbol, Order, OrderType, ORDER_DTYPE
+
+pytestmark = pytest.mark.usefixtures("orders_guard")
 
 
+@pytest.mark.slow
 def test_market_buy(mt4: MT4Client, symbol: Symbol) -> Order:
     # create a market order using relative stops
     bid = symbol.tick.bid
@@ -21,6 +26,7 @@ def test_market_buy(mt4: MT4Client, symbol: Symbol) -> Order:
     return order
 
 
+@pytest.mark.slow
 def test_market_sell(mt4: MT4Client, symbol: Symbol) -> Order:
     # create a market order using absolute stops
     bid = symbol.tick.bid
@@ -43,6 +49,7 @@ def test_market_sell(mt4: MT4Client, symbol: Symbol) -> Order:
     return order
 
 
+@pytest.mark.slow
 def test_limit_buy(mt4: MT4Client, symbol: Symbol) -> Order:
     # create a pending buy order with relative sl/tp
     optimistic_buy_price = symbol.tick.ask / 2
@@ -65,6 +72,7 @@ def test_limit_buy(mt4: MT4Client, symbol: Symbol) -> Order:
     return order
 
 
+@pytest.mark.slow
 def test_limit_sell(mt4: MT4Client, symbol: Symbol) -> Order:
     # create a pending sell order with no sl/tp
     optimistic_sell_price = symbol.tick.bid * 2
@@ -84,6 +92,7 @@ def test_limit_sell(mt4: MT4Client, symbol: Symbol) -> Order:
     return order
 
 
+@pytest.mark.slow
 def test_modify_open_order(mt4: MT4Client, symbol: Symbol):
     # create a market order
     order = mt4.order_send(
@@ -105,6 +114,7 @@ def test_modify_open_order(mt4: MT4Client, symbol: Symbol):
     print(f"Order open_price/sl/tp: {order.open_price}/{order.sl}/{order.tp}")
 
 
+@pytest.mark.slow
 def test_modify_pending_order(mt4: MT4Client, symbol: Symbol):
     # create a pending order
     optimistic_buy_price = symbol.tick.ask / 2
@@ -134,6 +144,7 @@ def test_modify_pending_order(mt4: MT4Client, symbol: Symbol):
     print(f"Order open_price/sl/tp: {order.open_price}/{order.sl}/{order.tp}")
 
 
+@pytest.mark.slow
 def test_close_open_order(mt4: MT4Client, symbol: Symbol):
     # create a market order
     order = mt4.order_send(
@@ -153,6 +164,7 @@ def test_close_open_order(mt4: MT4Client, symbol: Symbol):
     print(f"Open order # {order.ticket} was closed.")
 
 
+@pytest.mark.slow
 def test_delete_pending_order(mt4: MT4Client, symbol: Symbol):
     # create a pending order
     optimistic_buy_price = symbol.tick.ask / 2
@@ -174,6 +186,25 @@ def test_delete_pending_order(mt4: MT4Client, symbol: Symbol):
     print(f"Pending order # {order.ticket} was deleted.")
 
 
+@pytest.mark.slow
+def test_delete_pending_orders(mt4: MT4Client, symbol: Symbol):
+    # create two pending orders
+    optimistic_buy_price = symbol.tick.ask / 2
+    orders = [mt4.order_send(
+        symbol=symbol,
+        lots=symbol.volume_min,
+        order_type=OrderType.OP_BUYLIMIT,
+        price=optimistic_buy_price
+    ) for _ in range(2)]
+
+    # delete both orders at once
+    results = mt4.orders_delete(orders)
+    assert results == {order.ticket: None for order in orders}
+    tickets = set(results)
+    assert not any(x.ticket in tickets for x in mt4.orders())
+    print(f"Pending orders # {', '.join(str(ticket) for ticket in tickets)} were deleted.")
+
+
 def test_orders(mt4: MT4Client):
     orders = mt4.orders()
     assert isinstance(orders, list)
@@ -186,8 +217,16 @@ def test_orders_historical(mt4: MT4Client):
     print(f"Found {len(orders)} historical orders.")
 
 
+def test_orders_historical_array(mt4: MT4Client):
+    pytest.importorskip("numpy")
+    orders = mt4.orders_historical_array()
+    assert orders.dtype.names == tuple(name for name, _ in ORDER_DTYPE)
+    print(f"Found {len(orders)} historical orders, with a total profit of {orders['profit'].sum()}.")
+
+
+@pytest.mark.slow
 def test_close_all_orders(mt4: MT4Client):
-    # close/delete all orders
-    for order in mt4.orders():
-        mt4.order_delete(order, close_if_opened=True)
+    # close/delete all orders at once
+    results = mt4.orders_delete(mt4.orders(), close_if_opened=True)
+    assert all(result is None for result in results.values())
     assert len(mt4.orders()) == 0
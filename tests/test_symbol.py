@@ -2,16 +2,13 @@
 
 import pytest
 from enum import Enum
+from typing import List
 
 from mt4client.api import Symbol, StandardTimeframe
+from mt4client.api.symbol import SymbolInfoInteger, SymbolInfoDouble
 from mt4client import MT4Client
 
 
-@pytest.fixture(scope="module")
-def symbol(mt4: MT4Client, symbol_name: str) -> Symbol:
-    return mt4.symbol(symbol_name)
-
-
 def test_symbol_tick(symbol: Symbol):
     tick = symbol.tick
     assert isinstance(tick.time, int)
@@ -21,6 +18,15 @@ def test_symbol_tick(symbol: Symbol):
     assert isinstance(tick.volume, int)
 
 
+def test_symbol_refresh(symbol: Symbol):
+    values = symbol.refresh([SymbolInfoInteger.SYMBOL_SPREAD, SymbolInfoDouble.SYMBOL_BID])
+    assert list(values) == [SymbolInfoInteger.SYMBOL_SPREAD, SymbolInfoDouble.SYMBOL_BID]
+    assert isinstance(values[SymbolInfoInteger.SYMBOL_SPREAD], int)
+    assert isinstance(values[SymbolInfoDouble.SYMBOL_BID], float)
+    print(f"Symbol spread/bid after refresh: {values[SymbolInfoInteger.SYMBOL_SPREAD]}/"
+          f"{values[SymbolInfoDouble.SYMBOL_BID]}")
+
+
 def test_fetch_ohlcv(symbol: Symbol):
     ohlcv = symbol.ohlcv("1h", 100)
     assert isinstance(ohlcv, list)
@@ -28,19 +34,43 @@ def test_fetch_ohlcv(symbol: Symbol):
     print(f"Found {len(ohlcv)} OHLCV bars. The first one: {ohlcv[0]}")
 
 
-def test_symbol_names(mt4: MT4Client):
-    symbol_names = mt4.symbol_names()
+def test_fetch_ohlcv_array(symbol: Symbol):
+    pytest.importorskip("numpy")
+    bars = symbol.ohlcv_array("1h", 100)
+    assert bars.shape == (100,)
+    assert bars.dtype.names == ("open", "high", "low", "close", "tick_volume", "time")
+    assert bars["close"].min() > 0
+    assert (bars["high"] >= bars["low"]).all()
+    print(f"Found {len(bars)} OHLCV bars. The first one: {bars[0]}")
+
+
+def test_max_drawdown(symbol: Symbol):
+    pytest.importorskip("numpy")
+    mdd = symbol.max_drawdown("1h", 100)
+    assert -1.0 < mdd <= 0.0
+    print(f"Max drawdown of {symbol.name} over 100 hourly bars: {mdd:.2%}")
+
+
+def test_symbol_names(symbol_names: List[str]):
     assert isinstance(symbol_names, list)
     print(f"All symbols: {symbol_names}")
 
 
-def test_symbols(mt4: MT4Client):
-    symbols = mt4.symbols(*mt4.symbol_names()[0:3])
+def test_symbols(mt4: MT4Client, symbol_names: List[str]):
+    symbols = mt4.symbols(*symbol_names[0:3])
     assert isinstance(symbols, dict)
     assert len(symbols) == 3
     print(f"Found {len(symbols)} symbols. The first one: {next(iter(symbols.items()))}")
 
 
+def test_ticks(mt4: MT4Client, symbol_names: List[str]):
+    names = symbol_names[0:3]
+    ticks = mt4.ticks(*names)
+    assert list(ticks) == names
+    assert all(isinstance(tick.bid, float) for tick in ticks.values())
+    print(f"Found {len(ticks)} ticks. The first one: {next(iter(ticks.items()))}")
+
+
 def test_indicator(mt4: MT4Client, symbol: Symbol):
     func = "iAC"
     args = [symbol.name, StandardTimeframe.PERIOD_H1.value, 1]